@@ -1,7 +1,7 @@
 # Copyright (c) Microsoft Corporation and contributors.
 # Licensed under the MIT License.
 
-from collections import defaultdict, namedtuple
+from collections import namedtuple
 import numpy as np
 import pandas as pd
 import pytest
@@ -12,7 +12,7 @@ from fairlearn.postprocessing._threshold_operation import ThresholdOperation
 from fairlearn.postprocessing._constants import SCORE_KEY, LABEL_KEY, SENSITIVE_FEATURE_KEY
 
 from test.unit.input_convertors import ensure_list_1d, ensure_ndarray, ensure_ndarray_2d, \
-    ensure_dataframe, ensure_series, _map_into_single_column
+    ensure_dataframe, ensure_series
 
 
 X_ex = np.stack(([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19],
@@ -38,7 +38,17 @@ candidate_Y_transforms = [ensure_list_1d, ensure_ndarray, ensure_series, ensure_
 candidate_A_transforms = [ensure_list_1d, ensure_ndarray, ensure_ndarray_2d, ensure_series,
                           ensure_dataframe]
 
-LabelAndPrediction = namedtuple('LabelAndPrediction', 'label prediction')
+# Representative (X, y, sensitive_features) transform combinations for the
+# end-to-end tests. The full Cartesian product of the candidate transforms
+# converges to the same internal representations inside fit, so all-numpy,
+# all-pandas, mixed, and list-based inputs provide the same coverage at a
+# fraction of the test count.
+candidate_transform_combos = [
+    (ensure_ndarray, ensure_ndarray, ensure_ndarray),
+    (ensure_dataframe, ensure_series, ensure_series),
+    (ensure_dataframe, ensure_ndarray, ensure_ndarray_2d),
+    (ensure_ndarray, ensure_list_1d, ensure_list_1d)
+]
 
 _data = namedtuple('_data', 'example_name feature_names sensitive_features X y scores')
 
@@ -70,7 +80,10 @@ def data(request):
 
 
 def is_invalid_transformation(**kwargs):
-    sensitive_feature_transform = kwargs['data_sf']
+    if 'data_sf' in kwargs:
+        sensitive_feature_transform = kwargs['data_sf']
+    else:
+        sensitive_feature_transform = kwargs['data_X_y_sf'][2]
     sensitive_features = kwargs['data'].sensitive_features
 
     # Skip combinations where the multi-column sensitive features would have to be compressed
@@ -95,11 +108,12 @@ def data_X_sf(data_sf, request):  # sf is an abbreviation for sensitive features
     return data_sf
 
 
-@pytest.fixture(params=candidate_Y_transforms)
-def data_X_y_sf(data_X_sf, request):  # sf is an abbreviation for sensitive features
-    y_transform = request.param
-    data_X_sf._replace(y=y_transform(data_X_sf.y))
-    return data_X_sf
+@pytest.fixture(params=candidate_transform_combos)
+def data_X_y_sf(data, request):  # sf is an abbreviation for sensitive features
+    X_transform, y_transform, sensitive_feature_transform = request.param
+    return data._replace(X=X_transform(data.X),
+                         y=y_transform(data.y),
+                         sensitive_features=sensitive_feature_transform(data.sensitive_features))
 
 
 class ExamplePredictor(BaseEstimator, ClassifierMixin):
@@ -171,13 +185,3 @@ def _get_grouped_data_and_base_points(sensitive_feature_value):
         ignore_for_base_points = [0]
 
     return grouped_data, expected_roc_points, ignore_for_base_points, x_grid
-
-
-def _get_predictions_by_sensitive_feature(adjusted_predictor, sensitive_features, scores, labels):
-    labels_and_predictions = defaultdict(list)
-    sensitive_features_mapped = _map_into_single_column(sensitive_features)
-    for i in range(len(sensitive_features_mapped)):
-        labels_and_predictions[sensitive_features_mapped[i]].append(
-            LabelAndPrediction(labels[i],
-                               adjusted_predictor([sensitive_features_mapped[i]], [scores[i]])))
-    return labels_and_predictions